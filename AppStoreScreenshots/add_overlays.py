@@ -7,9 +7,16 @@ Designed to highlight the authentic Romanian heritage and premium gaming experie
 """
 
 import os
+import io
 import json
-from PIL import Image, ImageDraw, ImageFont
+import hashlib
+from dataclasses import dataclass
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, __version__ as PILLOW_VERSION
 import sys
+import zlib
 from pathlib import Path
 
 # Romanian flag colors
@@ -23,12 +30,122 @@ APP_STORE_BLACK = "#000000"
 APP_STORE_WHITE = "#FFFFFF"
 APP_STORE_GRAY = "#8E8E93"
 
+# Output format - App Store Connect accepts JPEG and PNG screenshots; high-quality
+# JPEG with full-resolution chroma looks identical and encodes much faster
+OUTPUT_FORMAT = "JPEG"
+OUTPUT_SUFFIXES = {"JPEG": ".jpg", "PNG": ".png"}
+JPEG_QUALITY = 92
+
+# PNG encoding - Pillow ignores `quality` for PNG; zlib level 1 is several
+# times faster than the default level 6 for a modest file-size increase, and the
+# RLE strategy skips most of the LZ77 match search while still collapsing the
+# flat runs in UI screenshots (Huffman-only inflates those roughly 15x)
+PNG_COMPRESS_LEVEL = 1
+PNG_COMPRESS_STRATEGY = zlib.Z_RLE
+
+# Incremental builds - outputs are skipped when the raw screenshot's mtime, this
+# script's overlay definitions, the font and Pillow are unchanged since they
+# were generated
+OUTPUT_CACHE_FILENAME = ".cache.json"
+OVERLAY_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+@dataclass(frozen=True)
+class OverlaySpec:
+    """Overlay text and colors for one kind of screenshot"""
+    kind: str
+    label: str
+    title: str
+    subtitle: str
+    title_color: str
+    subtitle_color: str
+    title_stroke_fill: str
+    subtitle_stroke_fill: str = APP_STORE_BLACK
+    # Hero layout (main menu): top gradient and a larger title with this tagline beneath it
+    tagline: Optional[str] = None
+    tagline_color: str = ROMANIAN_YELLOW
+
+# Raw screenshot filename -> overlay spec
+OVERLAY_SPECS = {
+    "01_main_menu.png": OverlaySpec(
+        kind="main_menu",
+        label="🏠 Processing main menu screenshot",
+        title="Experience Authentic Romanian Card Gaming",
+        subtitle="• Authentic Romanian Rules • Premium AI Opponent • Cultural Heritage Design",
+        title_color=APP_STORE_WHITE,
+        subtitle_color=APP_STORE_WHITE,
+        title_stroke_fill=APP_STORE_BLACK,
+        tagline="Jocul Tradițional Românesc"
+    ),
+    "02_gameplay.png": OverlaySpec(
+        kind="gameplay",
+        label="🎮 Processing gameplay screenshot",
+        title="7s Beat Any Card - Traditional Romanian Rules",
+        subtitle="Șaptele bate orice carte • Authentic Romanian Strategy",
+        title_color=ROMANIAN_RED,
+        subtitle_color=APP_STORE_WHITE,
+        title_stroke_fill=APP_STORE_WHITE
+    ),
+    "03_accessibility.png": OverlaySpec(
+        kind="accessibility",
+        label="♿ Processing accessibility screenshot",
+        title="Inclusive Gaming for All Romanian Heritage Enthusiasts",
+        subtitle="VoiceOver • Dynamic Type • High Contrast • Cultural Respect",
+        title_color=ROMANIAN_BLUE,
+        subtitle_color=APP_STORE_WHITE,
+        title_stroke_fill=APP_STORE_WHITE
+    ),
+    "04_cultural_heritage.png": OverlaySpec(
+        kind="cultural_heritage",
+        label="🏛️ Processing cultural heritage screenshot",
+        title="Preserving Romanian Card Game Traditions",
+        subtitle="Păstrăm tradițiile jocurilor românești cu mândrie",
+        title_color=ROMANIAN_YELLOW,
+        subtitle_color=APP_STORE_WHITE,
+        title_stroke_fill=APP_STORE_BLACK
+    ),
+    "05_statistics.png": OverlaySpec(
+        kind="statistics",
+        label="📊 Processing statistics screenshot",
+        title="Track Your Romanian Card Game Journey",
+        subtitle="Progress • Achievements • Cultural Milestones",
+        title_color=ROMANIAN_BLUE,
+        subtitle_color=APP_STORE_WHITE,
+        title_stroke_fill=APP_STORE_WHITE
+    ),
+    "06_victory.png": OverlaySpec(
+        kind="victory",
+        label="🏆 Processing victory screenshot",
+        title="Celebrate Your Romanian Heritage Victories",
+        subtitle="Felicitări! Ai câștigat cu stilul românesc!",
+        title_color=ROMANIAN_RED,
+        subtitle_color=ROMANIAN_YELLOW,
+        title_stroke_fill=APP_STORE_WHITE
+    )
+}
+
+def hex_to_rgb(color):
+    """Convert a '#RRGGBB' string to an (r, g, b) tuple"""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
 class ScreenshotOverlayGenerator:
-    def __init__(self, base_dir):
+    def __init__(self, base_dir, output_format=OUTPUT_FORMAT):
         self.base_dir = Path(base_dir)
+        self.output_format = output_format
         self.metadata_file = self.base_dir / "screenshot_metadata.json"
         self.metadata = self.load_metadata()
         
+        # Font lookups are repeated for every overlay; resolve and load each once
+        self._font_path = self.get_font_path()
+        self._font_cache = {}
+        
+        # Rendered text bitmaps, reused wherever the same string, size and colors recur
+        self._text_cache = {}
+        self._measure_draw = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+        
+        # Overlay pieces depend only on screenshot kind and device, not the screenshot
+        # itself; they are small bitmaps (text and the gradient band), not full frames
+        self._overlay_cache = {}
+        
     def load_metadata(self):
         """Load screenshot metadata from JSON file"""
         try:
@@ -55,367 +172,329 @@ class ScreenshotOverlayGenerator:
         # Fallback to default
         return None
     
-    def create_overlay_text(self, image, text, position, font_size, color, weight='regular', stroke_width=0, stroke_fill=None):
-        """Add text overlay to image"""
-        draw = ImageDraw.Draw(image)
-        
-        try:
-            font_path = self.get_font_path(weight)
-            if font_path:
-                font = ImageFont.truetype(font_path, font_size)
-            else:
+    def get_font(self, font_size):
+        """Get the overlay font at a given size, loading it on first use"""
+        key = (self._font_path, font_size)
+        font = self._font_cache.get(key)
+        if font is None:
+            try:
+                if self._font_path:
+                    font = ImageFont.truetype(self._font_path, font_size)
+                else:
+                    font = ImageFont.load_default()
+            except OSError as e:
+                print(f"⚠️  Could not load font {self._font_path}: {e}", flush=True)
                 font = ImageFont.load_default()
-        except:
-            font = ImageFont.load_default()
-        
-        # Add text with optional stroke
-        if stroke_width > 0 and stroke_fill:
-            draw.text(position, text, font=font, fill=color, stroke_width=stroke_width, stroke_fill=stroke_fill)
+            self._font_cache[key] = font
+        return font
+    
+    def _load_rgba(self, input_path):
+        """Load a screenshot as RGBA"""
+        with Image.open(input_path) as source:
+            return source.convert('RGBA')
+    
+    def _save_png(self, image, output):
+        """Save image as RGB PNG to a path or file object using fast zlib compression"""
+        image.convert('RGB').save(
+            output,
+            'PNG',
+            compress_level=PNG_COMPRESS_LEVEL,
+            compress_type=PNG_COMPRESS_STRATEGY,
+            optimize=False
+        )
+    
+    def _save_jpeg(self, image, output):
+        """Save image as high-quality baseline RGB JPEG to a path or file object without chroma subsampling"""
+        # Progressive encoding is avoided: Pillow then buffers the whole image in
+        # width * height bytes and fails on screenshots that compress worse than
+        # 1 byte/pixel, and it forces slower optimized Huffman tables
+        image.convert('RGB').save(output, 'JPEG', quality=JPEG_QUALITY, subsampling=0, progressive=False, optimize=False)
+    
+    def save_screenshot(self, image, output_path):
+        """Save a processed screenshot in the configured output format"""
+        # Encode in memory, then write the file in one sequential write
+        buffer = io.BytesIO()
+        if self.output_format == "PNG":
+            self._save_png(image, buffer)
         else:
-            draw.text(position, text, font=font, fill=color)
+            self._save_jpeg(image, buffer)
+        Path(output_path).write_bytes(buffer.getbuffer())
         
-        return image
+        # Remove any output left over from a run in another format
+        for suffix in OUTPUT_SUFFIXES.values():
+            stale_path = Path(output_path).with_suffix(suffix)
+            if stale_path != Path(output_path) and stale_path.exists():
+                stale_path.unlink()
     
-    def add_gradient_overlay(self, image, start_color, end_color, position, size, opacity=0.8):
-        """Add gradient overlay for better text readability"""
-        overlay = Image.new('RGBA', image.size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
-        
-        # Simple gradient simulation with rectangles of varying opacity
+    def get_text_image(self, text, font_size, color, stroke_width=0, stroke_fill=None):
+        """Get a tightly cropped RGBA rendering of text and its offset from the draw position"""
+        key = (text, font_size, color, stroke_width, stroke_fill)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            font = self.get_font(font_size)
+            if not (stroke_width > 0 and stroke_fill):
+                stroke_width, stroke_fill = 0, None
+            
+            left, top, right, bottom = self._measure_draw.textbbox(
+                (0, 0), text, font=font, stroke_width=stroke_width
+            )
+            text_image = Image.new('RGBA', (max(right - left, 1), max(bottom - top, 1)), (0, 0, 0, 0))
+            ImageDraw.Draw(text_image).text(
+                (-left, -top), text, font=font, fill=color, stroke_width=stroke_width, stroke_fill=stroke_fill
+            )
+            cached = self._text_cache[key] = (text_image, (left, top))
+        return cached
+    
+    def get_text_piece(self, text, position, font_size, color, stroke_width=0, stroke_fill=None):
+        """Get a cached text bitmap and the destination to composite it at for a draw position"""
+        text_image, (left, top) = self.get_text_image(text, font_size, color, stroke_width, stroke_fill)
+        return text_image, (position[0] + left, position[1] + top)
+    
+    def get_gradient_band(self, image_size, start_color, position, size, opacity=0.8):
+        """Build the non-transparent band of a gradient overlay, clipped to the image, and its destination"""
         x, y = position
         width, height = size
+        rgb = start_color if isinstance(start_color, tuple) else hex_to_rgb(start_color)
+        
+        # Alpha fades linearly from `opacity` at the top edge to transparent
+        alpha = (opacity * 255 * (1 - np.arange(height) / height)).astype(np.uint8)
+        
+        band_width = min(width, image_size[0] - x)
+        band_height = min(height, image_size[1] - y)
+        if band_width <= 0 or band_height <= 0:
+            return None
         
-        for i in range(height):
-            alpha = int(opacity * 255 * (1 - i / height))
-            color = (*start_color, alpha) if isinstance(start_color, tuple) else (*tuple(int(start_color[1:][i:i+2], 16) for i in (0, 2, 4)), alpha)
-            draw.rectangle([x, y + i, x + width, y + i + 1], fill=color)
+        # Pack each row's RGBA into one 32-bit pixel and repeat it across the band -
+        # a contiguous fill instead of separate strided writes per channel
+        row_pixels = np.empty((band_height, 1, 4), dtype=np.uint8)
+        row_pixels[..., :3] = rgb
+        row_pixels[..., 3] = alpha[:band_height, None]
+        band = np.repeat(row_pixels.view(np.uint32), band_width, axis=1).view(np.uint8)
         
-        # Composite overlay onto image
-        return Image.alpha_composite(image.convert('RGBA'), overlay).convert('RGB')
+        return Image.fromarray(band), (x, y)
     
-    def process_main_menu_screenshot(self, input_path, output_path, device_type):
-        """Process main menu screenshot with Romanian cultural overlay"""
-        print(f"🏠 Processing main menu screenshot: {device_type}")
+    def get_overlay_pieces(self, spec, device_type, size):
+        """Get a screenshot kind's overlay as (bitmap, dest) pieces, building them once per device and size"""
+        key = (spec.kind, device_type, size)
+        pieces = self._overlay_cache.get(key)
+        if pieces is None:
+            pieces = self._overlay_cache[key] = self.build_overlay_pieces(spec, device_type, size)
+        return pieces
+    
+    def build_overlay_pieces(self, spec, device_type, size):
+        """Build the gradient band and text bitmaps for a screenshot kind, in compositing order"""
+        width, height = size
+        is_iphone = device_type.startswith('iPhone')
+        pieces = []
         
-        try:
-            image = Image.open(input_path)
-            width, height = image.size
-            
-            # Convert to RGBA for overlay work
-            image = image.convert('RGBA')
-            
+        if spec.tagline:
             # Add gradient overlay at top for better text readability
             gradient_height = int(height * 0.3)
-            image = self.add_gradient_overlay(
-                image, 
-                (0, 0, 0), 
-                (0, 0, 0), 
-                (0, 0), 
-                (width, gradient_height), 
-                opacity=0.4
-            )
+            band = self.get_gradient_band(size, (0, 0, 0), (0, 0), (width, gradient_height), opacity=0.4)
+            if band:
+                pieces.append(band)
             
-            # Main title overlay
-            title_font_size = int(width * 0.08) if device_type.startswith('iPhone') else int(width * 0.06)
-            subtitle_font_size = int(width * 0.045) if device_type.startswith('iPhone') else int(width * 0.035)
-            
-            # Romanian title
             title_y = int(height * 0.1)
-            self.create_overlay_text(
-                image,
-                "Experience Authentic Romanian Card Gaming",
-                (int(width * 0.05), title_y),
-                title_font_size,
-                APP_STORE_WHITE,
-                weight='bold',
-                stroke_width=2,
-                stroke_fill=APP_STORE_BLACK
-            )
-            
-            # Romanian subtitle
-            subtitle_y = title_y + title_font_size + 10
-            self.create_overlay_text(
-                image,
-                "Jocul Tradițional Românesc",
-                (int(width * 0.05), subtitle_y),
-                subtitle_font_size,
-                ROMANIAN_YELLOW,
-                stroke_width=1,
-                stroke_fill=APP_STORE_BLACK
-            )
-            
-            # Feature highlight at bottom
-            feature_y = int(height * 0.85)
-            feature_font_size = int(width * 0.035) if device_type.startswith('iPhone') else int(width * 0.025)
-            
-            self.create_overlay_text(
-                image,
-                "• Authentic Romanian Rules • Premium AI Opponent • Cultural Heritage Design",
-                (int(width * 0.05), feature_y),
-                feature_font_size,
-                APP_STORE_WHITE,
-                stroke_width=1,
-                stroke_fill=APP_STORE_BLACK
-            )
-            
-            # Save processed image
-            image.convert('RGB').save(output_path, 'PNG', quality=95)
-            print(f"✅ Saved: {output_path}")
-            
-        except Exception as e:
-            print(f"❌ Error processing {input_path}: {e}")
-    
-    def process_gameplay_screenshot(self, input_path, output_path, device_type):
-        """Process gameplay screenshot with rule highlights"""
-        print(f"🎮 Processing gameplay screenshot: {device_type}")
+            title_font_size = int(width * 0.08) if is_iphone else int(width * 0.06)
+            subtitle_y = int(height * 0.85)
+        else:
+            title_y = int(height * 0.08)
+            title_font_size = int(width * 0.06) if is_iphone else int(width * 0.045)
+            subtitle_y = int(height * 0.88)
         
-        try:
-            image = Image.open(input_path)
-            width, height = image.size
-            image = image.convert('RGBA')
-            
-            # Title overlay
-            title_font_size = int(width * 0.06) if device_type.startswith('iPhone') else int(width * 0.045)
-            
-            self.create_overlay_text(
-                image,
-                "7s Beat Any Card - Traditional Romanian Rules",
-                (int(width * 0.05), int(height * 0.08)),
-                title_font_size,
-                ROMANIAN_RED,
-                weight='bold',
-                stroke_width=2,
-                stroke_fill=APP_STORE_WHITE
-            )
-            
-            # Rule explanation
-            rule_font_size = int(width * 0.035) if device_type.startswith('iPhone') else int(width * 0.025)
-            self.create_overlay_text(
-                image,
-                "Șaptele bate orice carte • Authentic Romanian Strategy",
-                (int(width * 0.05), int(height * 0.88)),
-                rule_font_size,
-                APP_STORE_WHITE,
-                stroke_width=1,
-                stroke_fill=APP_STORE_BLACK
-            )
-            
-            image.convert('RGB').save(output_path, 'PNG', quality=95)
-            print(f"✅ Saved: {output_path}")
-            
-        except Exception as e:
-            print(f"❌ Error processing {input_path}: {e}")
-    
-    def process_accessibility_screenshot(self, input_path, output_path, device_type):
-        """Process accessibility screenshot"""
-        print(f"♿ Processing accessibility screenshot: {device_type}")
+        subtitle_font_size = int(width * 0.035) if is_iphone else int(width * 0.025)
         
-        try:
-            image = Image.open(input_path)
-            width, height = image.size
-            image = image.convert('RGBA')
-            
-            title_font_size = int(width * 0.06) if device_type.startswith('iPhone') else int(width * 0.045)
-            
-            self.create_overlay_text(
-                image,
-                "Inclusive Gaming for All Romanian Heritage Enthusiasts",
-                (int(width * 0.05), int(height * 0.08)),
-                title_font_size,
-                ROMANIAN_BLUE,
-                weight='bold',
-                stroke_width=2,
-                stroke_fill=APP_STORE_WHITE
-            )
-            
-            feature_font_size = int(width * 0.035) if device_type.startswith('iPhone') else int(width * 0.025)
-            self.create_overlay_text(
-                image,
-                "VoiceOver • Dynamic Type • High Contrast • Cultural Respect",
-                (int(width * 0.05), int(height * 0.88)),
-                feature_font_size,
-                APP_STORE_WHITE,
-                stroke_width=1,
-                stroke_fill=APP_STORE_BLACK
-            )
-            
-            image.convert('RGB').save(output_path, 'PNG', quality=95)
-            print(f"✅ Saved: {output_path}")
-            
-        except Exception as e:
-            print(f"❌ Error processing {input_path}: {e}")
-    
-    def process_cultural_heritage_screenshot(self, input_path, output_path, device_type):
-        """Process cultural heritage screenshot"""
-        print(f"🏛️ Processing cultural heritage screenshot: {device_type}")
+        # Title overlay
+        pieces.append(self.get_text_piece(
+            spec.title,
+            (int(width * 0.05), title_y),
+            title_font_size,
+            spec.title_color,
+            stroke_width=2,
+            stroke_fill=spec.title_stroke_fill
+        ))
         
-        try:
-            image = Image.open(input_path)
-            width, height = image.size
-            image = image.convert('RGBA')
-            
-            title_font_size = int(width * 0.06) if device_type.startswith('iPhone') else int(width * 0.045)
-            
-            self.create_overlay_text(
-                image,
-                "Preserving Romanian Card Game Traditions",
-                (int(width * 0.05), int(height * 0.08)),
-                title_font_size,
-                ROMANIAN_YELLOW,
-                weight='bold',
-                stroke_width=2,
-                stroke_fill=APP_STORE_BLACK
-            )
-            
-            heritage_font_size = int(width * 0.035) if device_type.startswith('iPhone') else int(width * 0.025)
-            self.create_overlay_text(
-                image,
-                "Păstrăm tradițiile jocurilor românești cu mândrie",
-                (int(width * 0.05), int(height * 0.88)),
-                heritage_font_size,
-                APP_STORE_WHITE,
+        # Romanian tagline directly beneath the hero title
+        if spec.tagline:
+            tagline_font_size = int(width * 0.045) if is_iphone else int(width * 0.035)
+            pieces.append(self.get_text_piece(
+                spec.tagline,
+                (int(width * 0.05), title_y + title_font_size + 10),
+                tagline_font_size,
+                spec.tagline_color,
                 stroke_width=1,
                 stroke_fill=APP_STORE_BLACK
-            )
-            
-            image.convert('RGB').save(output_path, 'PNG', quality=95)
-            print(f"✅ Saved: {output_path}")
-            
-        except Exception as e:
-            print(f"❌ Error processing {input_path}: {e}")
+            ))
+        
+        # Feature / rule highlight at bottom
+        pieces.append(self.get_text_piece(
+            spec.subtitle,
+            (int(width * 0.05), subtitle_y),
+            subtitle_font_size,
+            spec.subtitle_color,
+            stroke_width=1,
+            stroke_fill=spec.subtitle_stroke_fill
+        ))
+        
+        return pieces
     
-    def process_statistics_screenshot(self, input_path, output_path, device_type):
-        """Process statistics screenshot"""
-        print(f"📊 Processing statistics screenshot: {device_type}")
+    def process_screenshot(self, spec, input_path, output_path, device_type):
+        """Process a screenshot with the overlays described by its spec"""
+        # Flush each line so output from parallel workers doesn't interleave
+        print(f"{spec.label}: {device_type}", flush=True)
         
         try:
-            image = Image.open(input_path)
-            width, height = image.size
-            image = image.convert('RGBA')
+            image = self._load_rgba(input_path)
             
-            title_font_size = int(width * 0.06) if device_type.startswith('iPhone') else int(width * 0.045)
+            # Composite only the overlay pieces, touching just the pixels they cover
+            for bitmap, dest in self.get_overlay_pieces(spec, device_type, image.size):
+                image.alpha_composite(bitmap, dest=dest)
             
-            self.create_overlay_text(
-                image,
-                "Track Your Romanian Card Game Journey",
-                (int(width * 0.05), int(height * 0.08)),
-                title_font_size,
-                ROMANIAN_BLUE,
-                weight='bold',
-                stroke_width=2,
-                stroke_fill=APP_STORE_WHITE
-            )
-            
-            stats_font_size = int(width * 0.035) if device_type.startswith('iPhone') else int(width * 0.025)
-            self.create_overlay_text(
-                image,
-                "Progress • Achievements • Cultural Milestones",
-                (int(width * 0.05), int(height * 0.88)),
-                stats_font_size,
-                APP_STORE_WHITE,
-                stroke_width=1,
-                stroke_fill=APP_STORE_BLACK
-            )
-            
-            image.convert('RGB').save(output_path, 'PNG', quality=95)
-            print(f"✅ Saved: {output_path}")
+            self.save_screenshot(image, output_path)
+            print(f"✅ Saved: {output_path}", flush=True)
+            return True
             
         except Exception as e:
-            print(f"❌ Error processing {input_path}: {e}")
+            print(f"❌ Error processing {input_path}: {e}", flush=True)
+            return False
     
-    def process_victory_screenshot(self, input_path, output_path, device_type):
-        """Process victory screenshot"""
-        print(f"🏆 Processing victory screenshot: {device_type}")
-        
+    def load_output_cache(self, processed_dir):
+        """Load the processed-output cache sidecar for a device"""
         try:
-            image = Image.open(input_path)
-            width, height = image.size
-            image = image.convert('RGBA')
-            
-            title_font_size = int(width * 0.06) if device_type.startswith('iPhone') else int(width * 0.045)
-            
-            self.create_overlay_text(
-                image,
-                "Celebrate Your Romanian Heritage Victories",
-                (int(width * 0.05), int(height * 0.08)),
-                title_font_size,
-                ROMANIAN_RED,
-                weight='bold',
-                stroke_width=2,
-                stroke_fill=APP_STORE_WHITE
-            )
-            
-            victory_font_size = int(width * 0.035) if device_type.startswith('iPhone') else int(width * 0.025)
-            self.create_overlay_text(
-                image,
-                "Felicitări! Ai câștigat cu stilul românesc!",
-                (int(width * 0.05), int(height * 0.88)),
-                victory_font_size,
-                ROMANIAN_YELLOW,
-                stroke_width=1,
-                stroke_fill=APP_STORE_BLACK
-            )
-            
-            image.convert('RGB').save(output_path, 'PNG', quality=95)
-            print(f"✅ Saved: {output_path}")
-            
-        except Exception as e:
-            print(f"❌ Error processing {input_path}: {e}")
+            with open(processed_dir / OUTPUT_CACHE_FILENAME, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
     
-    def process_screenshots_for_device(self, device_type):
-        """Process all screenshots for a specific device type"""
+    def save_output_cache(self, processed_dir, cache):
+        """Save the processed-output cache sidecar for a device"""
+        with open(processed_dir / OUTPUT_CACHE_FILENAME, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    
+    def cache_entry(self, raw_path):
+        """Cache entry describing the inputs an output was generated from"""
+        # The font and Pillow build affect rendering too, so installing or fixing
+        # the font (or upgrading Pillow) regenerates outputs made with the fallback
+        return {
+            "source_mtime": os.path.getmtime(raw_path),
+            "overlay_version": OVERLAY_VERSION,
+            "font_path": self._font_path,
+            "font_mtime": os.path.getmtime(self._font_path) if self._font_path else None,
+            "pillow_version": PILLOW_VERSION
+        }
+    
+    def collect_jobs_for_device(self, device_type, force=False):
+        """Collect (overlay spec, raw path, processed path, device) jobs for a device"""
         device_dir = self.base_dir / device_type
         raw_dir = device_dir / "Raw"
         processed_dir = device_dir / "Processed"
         
         if not raw_dir.exists():
             print(f"⚠️  Raw directory not found: {raw_dir}")
-            return
+            return []
         
         # Create processed directory
         processed_dir.mkdir(exist_ok=True)
+        cache = {} if force else self.load_output_cache(processed_dir)
         
-        # Screenshot processing mapping
-        screenshot_processors = {
-            "01_main_menu.png": self.process_main_menu_screenshot,
-            "02_gameplay.png": self.process_gameplay_screenshot,
-            "03_accessibility.png": self.process_accessibility_screenshot,
-            "04_cultural_heritage.png": self.process_cultural_heritage_screenshot,
-            "05_statistics.png": self.process_statistics_screenshot,
-            "06_victory.png": self.process_victory_screenshot
-        }
-        
-        for filename, processor in screenshot_processors.items():
+        jobs = []
+        for filename, spec in OVERLAY_SPECS.items():
             raw_path = raw_dir / filename
-            processed_path = processed_dir / filename
+            processed_path = processed_dir / Path(filename).with_suffix(OUTPUT_SUFFIXES[self.output_format])
             
-            if raw_path.exists():
-                processor(raw_path, processed_path, device_type)
-            else:
+            if not raw_path.exists():
                 print(f"⚠️  Screenshot not found: {raw_path}")
+            elif processed_path.exists() and cache.get(processed_path.name) == self.cache_entry(raw_path):
+                print(f"⏭️  Up to date: {processed_path}")
+            else:
+                jobs.append((spec, raw_path, processed_path, device_type))
+        
+        return jobs
+    
+    def record_outputs(self, jobs, results):
+        """Update the output cache sidecars for successfully processed jobs"""
+        updates = {}
+        for (_, raw_path, processed_path, _), succeeded in zip(jobs, results):
+            if succeeded:
+                updates.setdefault(processed_path.parent, {})[processed_path.name] = self.cache_entry(raw_path)
+        
+        for processed_dir, entries in updates.items():
+            cache = self.load_output_cache(processed_dir)
+            cache.update(entries)
+            self.save_output_cache(processed_dir, cache)
+    
+    def run_job(self, job):
+        """Run a single screenshot processing job, returning whether it succeeded"""
+        return self.process_screenshot(*job)
     
-    def process_all_screenshots(self):
-        """Process screenshots for all device types"""
+    def process_screenshots_for_device(self, device_type, force=False):
+        """Process all screenshots for a specific device type"""
+        jobs = self.collect_jobs_for_device(device_type, force)
+        self.record_outputs(jobs, [self.run_job(job) for job in jobs])
+    
+    def process_all_screenshots(self, max_workers=None, force=False):
+        """Process screenshots for all device types in parallel"""
         device_types = ["iPhone_6.7", "iPhone_6.5", "iPhone_5.5", "iPad_12.9", "iPad_11.0"]
         
         print("🇷🇴 Starting Romanian Septica Screenshot Overlay Generation")
         print("=========================================================")
         
+        jobs = []
         for device_type in device_types:
-            print(f"\n📱 Processing {device_type}...")
-            self.process_screenshots_for_device(device_type)
+            print(f"\n📱 Collecting {device_type}...")
+            jobs.extend(self.collect_jobs_for_device(device_type, force))
+        
+        max_workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        if max_workers <= 1:
+            results = [self.run_job(job) for job in jobs]
+        else:
+            print(f"\n⚙️  Processing {len(jobs)} screenshots with {max_workers} workers...")
+            try:
+                executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.base_dir, self.output_format)
+                )
+            except (OSError, NotImplementedError):
+                # Process pools are unavailable on some platforms; Pillow releases
+                # the GIL while encoding/decoding, so threads still scale
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+                worker = self.run_job
+            else:
+                worker = _run_worker_job
+            
+            with executor:
+                results = list(executor.map(worker, jobs))
+        
+        self.record_outputs(jobs, results)
         
         print("\n🎉 Screenshot overlay generation complete!")
         print(f"📁 Processed screenshots saved in */Processed/ directories")
 
+# Per-process generator, so font caches persist across jobs in each worker
+_worker_generator = None
+
+def _init_worker(base_dir, output_format):
+    global _worker_generator
+    _worker_generator = ScreenshotOverlayGenerator(base_dir, output_format)
+
+def _run_worker_job(job):
+    return _worker_generator.run_job(job)
+
 def main():
-    if len(sys.argv) > 1:
-        base_dir = sys.argv[1]
+    # --force regenerates every screenshot, ignoring the output cache
+    # --png writes PNG instead of JPEG screenshots
+    flags = {arg for arg in sys.argv[1:] if arg.startswith('--')}
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    
+    if args:
+        base_dir = args[0]
     else:
         base_dir = os.path.dirname(os.path.abspath(__file__))
     
-    generator = ScreenshotOverlayGenerator(base_dir)
-    generator.process_all_screenshots()
+    output_format = "PNG" if '--png' in flags else OUTPUT_FORMAT
+    generator = ScreenshotOverlayGenerator(base_dir, output_format)
+    generator.process_all_screenshots(force='--force' in flags)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -24,16 +24,40 @@ if ! command -v python3 &> /dev/null; then
     exit 1
 fi
 
-# Check PIL/Pillow
-if ! python3 -c "import PIL" 2>/dev/null; then
-    echo "📦 Installing PIL/Pillow for image processing..."
-    pip3 install Pillow || {
-        echo "❌ Failed to install Pillow. Try:"
-        echo "   pip3 install --user Pillow"
+# Check PIL/Pillow 9.2+
+# Set PILLOW_PACKAGE="pillow-simd==9.*" to switch to the SIMD-accelerated build
+# (x86_64 only; add CC="cc -mavx2" to compile its AVX2 paths)
+PILLOW_PACKAGE="${PILLOW_PACKAGE:-Pillow>=9.2}"
+install_pillow() {
+    echo "📦 Installing $PILLOW_PACKAGE for image processing..."
+    pip3 install "$PILLOW_PACKAGE" || {
+        echo "❌ Failed to install $PILLOW_PACKAGE. Try:"
+        echo "   pip3 install --user 'Pillow>=9.2'"
         echo "   or"
         echo "   brew install pillow"
         exit 1
     }
+}
+
+if [[ "$(echo "$PILLOW_PACKAGE" | tr '[:upper:]' '[:lower:]')" == pillow-simd* ]]; then
+    if ! pip3 show pillow-simd &> /dev/null; then
+        # Pillow-SIMD and Pillow both install the PIL package, so Pillow must go first
+        echo "🔄 Replacing Pillow with $PILLOW_PACKAGE..."
+        pip3 uninstall -y Pillow
+        install_pillow
+    fi
+elif ! python3 -c "import sys, PIL; sys.exit(tuple(int(p) for p in PIL.__version__.split('.')[:2]) < (9, 2))" 2>/dev/null; then
+    install_pillow
+fi
+
+# Check NumPy
+if ! python3 -c "import numpy" 2>/dev/null; then
+    echo "📦 Installing NumPy for image processing..."
+    pip3 install numpy || {
+        echo "❌ Failed to install NumPy. Try:"
+        echo "   pip3 install --user numpy"
+        exit 1
+    }
 fi
 
 echo "✅ Dependencies checked successfully"
@@ -41,7 +65,7 @@ echo ""
 
 # Run the Python overlay script
 echo "🎨 Starting overlay generation..."
-python3 "$PYTHON_SCRIPT" "$SCRIPT_DIR"
+python3 "$PYTHON_SCRIPT" "$SCRIPT_DIR" "$@"
 
 echo ""
 echo "🎯 Next Steps:"
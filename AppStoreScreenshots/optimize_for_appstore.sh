@@ -41,7 +41,7 @@ optimize_device_screenshots() {
     local optimized_count=0
     
     # Process each screenshot
-    for screenshot in "$processed_dir"/*.png; do
+    for screenshot in "$processed_dir"/*.png "$processed_dir"/*.jpg; do
         if [[ -f "$screenshot" ]]; then
             screenshot_count=$((screenshot_count + 1))
             local filename=$(basename "$screenshot")
@@ -49,8 +49,32 @@ optimize_device_screenshots() {
             
             echo "  🖼️  Optimizing: $filename"
             
+            # Remove an optimized copy left over from a run in another format
+            local stem="${filename%.*}"
+            for stale_path in "$optimized_dir/$stem.png" "$optimized_dir/$stem.jpg"; do
+                if [[ "$stale_path" != "$output_path" && -f "$stale_path" ]]; then
+                    rm -f "$stale_path"
+                fi
+            done
+            
+            # Read JPEG dimensions so correctly sized JPEGs can be copied as-is
+            local source_dimensions=""
+            if [[ "$screenshot" == *.jpg ]]; then
+                if command -v identify &> /dev/null; then
+                    source_dimensions=$(identify -format "%wx%h" "$screenshot" 2>/dev/null)
+                elif command -v sips &> /dev/null; then
+                    source_dimensions=$(sips -g pixelWidth -g pixelHeight "$screenshot" 2>/dev/null | grep -E "pixelWidth|pixelHeight" | awk '{print $2}' | tr '\n' 'x' | sed 's/x$//')
+                fi
+            fi
+            
+            if [[ "$screenshot" == *.jpg && "$source_dimensions" == "$expected_resolution" ]]; then
+                # JPEGs are already lossy-encoded; avoid a second lossy generation
+                cp "$screenshot" "$output_path" && {
+                    optimized_count=$((optimized_count + 1))
+                    echo "    ➡️  Copied (JPEG already ${expected_resolution})"
+                }
             # Check if ImageMagick is available
-            if command -v convert &> /dev/null; then
+            elif command -v convert &> /dev/null; then
                 # Use ImageMagick for optimization
                 convert "$screenshot" -quality 90 -strip -resize "${expected_resolution}>" "$output_path" && {
                     optimized_count=$((optimized_count + 1))
@@ -111,7 +135,7 @@ echo "AppStoreScreenshots/"
 for device_type in "${!RESOLUTIONS[@]}"; do
     optimized_dir="$SCRIPT_DIR/$device_type/Optimized"
     if [[ -d "$optimized_dir" ]]; then
-        count=$(find "$optimized_dir" -name "*.png" | wc -l | tr -d ' ')
+        count=$(find "$optimized_dir" \( -name "*.png" -o -name "*.jpg" \) | wc -l | tr -d ' ')
         echo "├── $device_type/Optimized/ ($count screenshots - ${RESOLUTIONS[$device_type]})"
     fi
 done
@@ -125,7 +149,7 @@ total_screenshots=0
 for device_type in "${!RESOLUTIONS[@]}"; do
     optimized_dir="$SCRIPT_DIR/$device_type/Optimized"
     if [[ -d "$optimized_dir" ]]; then
-        count=$(find "$optimized_dir" -name "*.png" | wc -l | tr -d ' ')
+        count=$(find "$optimized_dir" \( -name "*.png" -o -name "*.jpg" \) | wc -l | tr -d ' ')
         total_screenshots=$((total_screenshots + count))
         
         if [[ $count -eq 6 ]]; then